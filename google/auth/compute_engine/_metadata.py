@@ -52,6 +52,12 @@ _METADATA_FLAVOR_HEADER = "metadata-flavor"
 _METADATA_FLAVOR_VALUE = "Google"
 _METADATA_HEADERS = {_METADATA_FLAVOR_HEADER: _METADATA_FLAVOR_VALUE}
 
+_SERVICE_ACCOUNT_PATH = "instance/service-accounts/{0}/"
+# Paths for the default service account, which is by far the most commonly
+# requested one, are built once at import time.
+_DEFAULT_SERVICE_ACCOUNT_PATH = _SERVICE_ACCOUNT_PATH.format("default")
+_DEFAULT_SERVICE_ACCOUNT_TOKEN_PATH = _DEFAULT_SERVICE_ACCOUNT_PATH + "token"
+
 # Timeout in seconds to wait for the GCE metadata server when detecting the
 # GCE environment.
 try:
@@ -228,7 +234,10 @@ def get_service_account_info(request, service_account="default"):
         google.auth.exceptions.TransportError: if an error occurred while
             retrieving metadata.
     """
-    path = "instance/service-accounts/{0}/".format(service_account)
+    if service_account == "default":
+        path = _DEFAULT_SERVICE_ACCOUNT_PATH
+    else:
+        path = _SERVICE_ACCOUNT_PATH.format(service_account)
     # See https://cloud.google.com/compute/docs/metadata#aggcontents
     # for more on the use of 'recursive'.
     return get(request, path, params={"recursive": "true"})
@@ -259,7 +268,10 @@ def get_service_account_token(request, service_account="default", scopes=None):
     else:
         params = None
 
-    path = "instance/service-accounts/{0}/token".format(service_account)
+    if service_account == "default":
+        path = _DEFAULT_SERVICE_ACCOUNT_TOKEN_PATH
+    else:
+        path = _SERVICE_ACCOUNT_PATH.format(service_account) + "token"
     token_json = get(request, path, params=params)
     token_expiry = _helpers.utcnow() + datetime.timedelta(
         seconds=token_json["expires_in"]
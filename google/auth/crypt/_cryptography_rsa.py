@@ -19,11 +19,15 @@ This is a much faster implementation than the default (in
 ``rsa`` library.
 """
 
+import threading
+
+import cachetools
 import cryptography.exceptions
 from cryptography.hazmat import backends
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import utils
 import cryptography.x509
 
 from google.auth import _helpers
@@ -33,6 +37,35 @@ _CERTIFICATE_MARKER = b"-----BEGIN CERTIFICATE-----"
 _BACKEND = backends.default_backend()
 _PADDING = padding.PKCS1v15()
 _SHA256 = hashes.SHA256()
+_PREHASHED_SHA256 = utils.Prehashed(_SHA256)
+# Cached entries hold both the PEM bytes and the deserialized key, so secret
+# key material stays in memory until it is evicted. Keep the cache small:
+# most processes only sign with a handful of service account keys.
+_PRIVATE_KEY_CACHE_SIZE = 16
+
+
+@cachetools.cached(
+    cachetools.LRUCache(maxsize=_PRIVATE_KEY_CACHE_SIZE), lock=threading.Lock()
+)
+def _load_pem_private_key(key):
+    """Deserializes a PEM-encoded private key, caching the result.
+
+    Parsing a PEM private key is relatively expensive, so keys are cached
+    by their serialized bytes to make repeated signer construction cheap.
+    The cache intentionally keeps the most recently used private keys, and
+    their PEM bytes, alive for the lifetime of the process.
+
+    Args:
+        key (bytes): The private key in PEM format.
+
+    Returns:
+        cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey: The
+        deserialized private key.
+
+    Raises:
+        ValueError: If ``cryptography`` "Could not deserialize key data."
+    """
+    return serialization.load_pem_private_key(key, password=None, backend=_BACKEND)
 
 
 class RSAVerifier(base.Verifier):
@@ -100,6 +133,9 @@ class RSASigner(base.Signer, base.FromServiceAccountMixin):
     def __init__(self, private_key, key_id=None):
         self._key = private_key
         self._key_id = key_id
+        # The last prefix passed to sign_with_prefix and the SHA-256 context
+        # that has already absorbed it.
+        self._prefix_hash = None
 
     @property
     @_helpers.copy_docstring(base.Signer)
@@ -108,9 +144,36 @@ class RSASigner(base.Signer, base.FromServiceAccountMixin):
 
     @_helpers.copy_docstring(base.Signer)
     def sign(self, message):
-        message = _helpers.to_bytes(message)
+        if not isinstance(message, bytes):
+            message = _helpers.to_bytes(message)
         return self._key.sign(message, _PADDING, _SHA256)
 
+    def sign_with_prefix(self, prefix, suffix):
+        """Signs the concatenation of ``prefix`` and ``suffix``.
+
+        The SHA-256 state after hashing ``prefix`` is kept and reused while
+        the same prefix is passed, so signing many messages that share a
+        prefix (such as JWTs with the same header) only hashes the suffix.
+
+        Args:
+            prefix (Union[str, bytes]): The leading part of the message.
+            suffix (Union[str, bytes]): The remainder of the message.
+
+        Returns:
+            bytes: The signature of ``prefix + suffix``.
+        """
+        prefix = _helpers.to_bytes(prefix)
+        prefix_hash = self._prefix_hash
+        if prefix_hash is None or prefix_hash[0] != prefix:
+            hash_ctx = hashes.Hash(_SHA256, backend=_BACKEND)
+            hash_ctx.update(prefix)
+            prefix_hash = (prefix, hash_ctx)
+            self._prefix_hash = prefix_hash
+
+        hash_ctx = prefix_hash[1].copy()
+        hash_ctx.update(_helpers.to_bytes(suffix))
+        return self._key.sign(hash_ctx.finalize(), _PADDING, _PREHASHED_SHA256)
+
     @classmethod
     def from_string(cls, key, key_id=None):
         """Construct a RSASigner from a private key in PEM format.
@@ -130,7 +193,5 @@ class RSASigner(base.Signer, base.FromServiceAccountMixin):
             ValueError: If ``cryptography`` "Could not deserialize key data."
         """
         key = _helpers.to_bytes(key)
-        private_key = serialization.load_pem_private_key(
-            key, password=None, backend=_BACKEND
-        )
+        private_key = _load_pem_private_key(key)
         return cls(private_key, key_id=key_id)
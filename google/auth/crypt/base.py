@@ -20,6 +20,7 @@ import json
 
 import six
 
+from google.auth import _helpers
 
 _JSON_FILE_PRIVATE_KEY = "private_key"
 _JSON_FILE_PRIVATE_KEY_ID = "private_key_id"
@@ -69,6 +70,21 @@ class Signer(object):
         # (pylint doesn't recognize that this is abstract)
         raise NotImplementedError("Sign must be implemented")
 
+    def sign_with_prefix(self, prefix, suffix):
+        """Signs the concatenation of ``prefix`` and ``suffix``.
+
+        Implementations may override this to reuse work across messages that
+        share the same prefix.
+
+        Args:
+            prefix (Union[str, bytes]): The leading part of the message.
+            suffix (Union[str, bytes]): The remainder of the message.
+
+        Returns:
+            bytes: The signature of ``prefix + suffix``.
+        """
+        return self.sign(_helpers.to_bytes(prefix) + _helpers.to_bytes(suffix))
+
 
 @six.add_metaclass(abc.ABCMeta)
 class FromServiceAccountMixin(object):
@@ -46,6 +46,32 @@ _STS_GRANT_TYPE = "urn:ietf:params:oauth:grant-type:token-exchange"
 _STS_REQUESTED_TOKEN_TYPE = "urn:ietf:params:oauth:token-type:access_token"
 # Cloud resource manager URL used to retrieve project information.
 _CLOUD_RESOURCE_MANAGER = "https://cloudresourcemanager.googleapis.com/v1/projects/"
+# How long a failed project ID lookup is remembered before it is retried. This
+# allows permissions granted later on to eventually be picked up.
+_PROJECT_ID_LOOKUP_FAILURE_TTL = datetime.timedelta(seconds=60)
+
+
+def _parse_project_number(audience):
+    """Extracts the project number from an STS audience.
+
+    Args:
+        audience (Optional[str]): The STS audience field.
+
+    Returns:
+        Optional[str]: The project number if present in the audience.
+    """
+    if not audience:
+        # Invalid configurations are reported by the subclasses.
+        return None
+    # STS audience pattern:
+    # //iam.googleapis.com/projects/$PROJECT_NUMBER/locations/...
+    components = audience.split("/")
+    try:
+        project_index = components.index("projects")
+        if project_index + 1 < len(components):
+            return components[project_index + 1] or None
+    except ValueError:
+        return None
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -116,6 +142,9 @@ class Credentials(credentials.Scoped, credentials.CredentialsWithQuotaProject):
         else:
             self._impersonated_credentials = None
         self._project_id = None
+        self._project_id_lookup_failed_at = None
+        # The audience is immutable, so the project number is only parsed once.
+        self._project_number = _parse_project_number(self._audience)
 
     @property
     def requires_scopes(self):
@@ -129,16 +158,7 @@ class Credentials(credentials.Scoped, credentials.CredentialsWithQuotaProject):
     @property
     def project_number(self):
         """Optional[str]: The project number corresponding to the workload identity pool."""
-
-        # STS audience pattern:
-        # //iam.googleapis.com/projects/$PROJECT_NUMBER/locations/...
-        components = self._audience.split("/")
-        try:
-            project_index = components.index("projects")
-            if project_index + 1 < len(components):
-                return components[project_index + 1] or None
-        except ValueError:
-            return None
+        return self._project_number
 
     @_helpers.copy_docstring(credentials.Scoped)
     def with_scopes(self, scopes, default_scopes=None):
@@ -172,7 +192,10 @@ class Credentials(credentials.Scoped, credentials.CredentialsWithQuotaProject):
     def get_project_id(self, request):
         """Retrieves the project ID corresponding to the workload identity pool.
 
-        When not determinable, None is returned.
+        When not determinable, None is returned. A failed cloud resource manager
+        lookup is remembered for a short period so repeated calls do not
+        re-issue the request; use :meth:`clear_project_id_cache` to retry
+        immediately.
 
         This is introduced to support the current pattern of using the Auth library:
 
@@ -192,11 +215,18 @@ class Credentials(credentials.Scoped, credentials.CredentialsWithQuotaProject):
         if self._project_id:
             # If already retrieved, return the cached project ID value.
             return self._project_id
+        if (
+            self._project_id_lookup_failed_at is not None
+            and _helpers.utcnow() - self._project_id_lookup_failed_at
+            < _PROJECT_ID_LOOKUP_FAILURE_TTL
+        ):
+            # Do not hit the cloud resource manager again right after a failure.
+            return None
         scopes = self._scopes if self._scopes is not None else self._default_scopes
         # Scopes are required in order to retrieve a valid access token.
-        if self.project_number and scopes:
+        if self._project_number and scopes:
             headers = {}
-            url = _CLOUD_RESOURCE_MANAGER + self.project_number
+            url = _CLOUD_RESOURCE_MANAGER + self._project_number
             self.before_request(request, "GET", url, headers)
             response = request(url=url, method="GET", headers=headers)
 
@@ -212,8 +242,19 @@ class Credentials(credentials.Scoped, credentials.CredentialsWithQuotaProject):
                 self._project_id = response_data.get("projectId")
                 return self._project_id
 
+            self._project_id_lookup_failed_at = _helpers.utcnow()
+
         return None
 
+    def clear_project_id_cache(self):
+        """Clears the cached project ID and any cached lookup failure.
+
+        The next call to :meth:`get_project_id` will query the cloud resource
+        manager again.
+        """
+        self._project_id = None
+        self._project_id_lookup_failed_at = None
+
     @_helpers.copy_docstring(credentials.Credentials)
     def refresh(self, request):
         scopes = self._scopes if self._scopes is not None else self._default_scopes
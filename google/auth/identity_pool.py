@@ -46,6 +46,8 @@ from google.auth import _helpers
 from google.auth import exceptions
 from google.auth import external_account
 
+_VALID_FORMAT_TYPES = frozenset(("text", "json"))
+
 
 class Credentials(external_account.Credentials):
     """External account credentials sourced from files and URLs."""
@@ -141,7 +143,7 @@ class Credentials(external_account.Credentials):
                 raise ValueError(
                     "Invalid Identity Pool credential_source field 'environment_id'"
                 )
-            if self._credential_source_format_type not in ["text", "json"]:
+            if self._credential_source_format_type not in _VALID_FORMAT_TYPES:
                 raise ValueError(
                     "Invalid credential_source format '{}'".format(
                         self._credential_source_format_type
@@ -159,6 +161,11 @@ class Credentials(external_account.Credentials):
             else:
                 self._credential_source_field_name = None
 
+        # Cache of the last subject token read from a file, keyed by the
+        # file's identity and modification time, so unchanged token files are
+        # not re-read or re-parsed.
+        self._file_cache = None
+
         if self._credential_source_file and self._credential_source_url:
             raise ValueError(
                 "Ambiguous credential_source. 'file' is mutually exclusive with 'url'."
@@ -170,26 +177,38 @@ class Credentials(external_account.Credentials):
 
     @_helpers.copy_docstring(external_account.Credentials)
     def retrieve_subject_token(self, request):
+        if self._credential_source_file:
+            return self._get_file_subject_token(self._credential_source_file)
         return self._parse_token_data(
-            self._get_token_data(request),
+            self._get_url_data(
+                request, self._credential_source_url, self._credential_source_headers
+            ),
             self._credential_source_format_type,
             self._credential_source_field_name,
         )
 
-    def _get_token_data(self, request):
-        if self._credential_source_file:
-            return self._get_file_data(self._credential_source_file)
-        else:
-            return self._get_url_data(
-                request, self._credential_source_url, self._credential_source_headers
-            )
-
-    def _get_file_data(self, filename):
-        if not os.path.exists(filename):
+    def _get_file_subject_token(self, filename):
+        try:
+            file_stat = os.stat(filename)
+        except OSError:
             raise exceptions.RefreshError("File '{}' was not found.".format(filename))
 
-        with io.open(filename, "r", encoding="utf-8") as file_obj:
-            return file_obj.read(), filename
+        # st_mtime_ns is only available on Python 3; fall back to the float
+        # st_mtime, which is coarser, on Python 2.
+        mtime = getattr(file_stat, "st_mtime_ns", file_stat.st_mtime)
+        file_key = (filename, file_stat.st_ino, file_stat.st_size, mtime)
+        if self._file_cache is not None and self._file_cache[0] == file_key:
+            return self._file_cache[1]
+
+        with io.open(filename, "rb") as file_obj:
+            content = file_obj.read()
+        token = self._parse_token_data(
+            (content, filename),
+            self._credential_source_format_type,
+            self._credential_source_field_name,
+        )
+        self._file_cache = (file_key, token)
+        return token
 
     def _get_url_data(self, request, url, headers):
         response = request(url=url, method="GET", headers=headers)
@@ -213,10 +232,11 @@ class Credentials(external_account.Credentials):
     ):
         content, filename = token_content
         if format_type == "text":
-            token = content
+            token = _helpers.from_bytes(content)
         else:
             try:
-                # Parse file content as JSON.
+                # Parse file content as JSON. json.loads accepts the raw
+                # bytes read from a file, so they are not decoded first.
                 response_data = json.loads(content)
                 # Get the subject_token.
                 token = response_data[subject_token_field_name]
@@ -274,6 +294,6 @@ class Credentials(external_account.Credentials):
             google.auth.identity_pool.Credentials: The constructed
                 credentials.
         """
-        with io.open(filename, "r", encoding="utf-8") as json_file:
-            data = json.load(json_file)
+        with io.open(filename, "rb") as json_file:
+            data = json.loads(json_file.read())
             return cls.from_info(data, **kwargs)
@@ -21,10 +21,10 @@ change in minor releases.
 from __future__ import absolute_import
 
 import asyncio
+from concurrent import futures
 import functools
 
 import aiohttp
-import six
 import urllib3
 
 from google.auth import exceptions
@@ -46,12 +46,14 @@ class _CombinedResponse(transport.Response):
     because the default parameter for autodecompress into the ClientSession is set
     to False, and therefore we add this class to act as a wrapper for a user to be
     able to access both the raw and decoded response bodies - mirroring the sync
-    implementation.
+    implementation. If the session already decompressed the body, it is
+    returned as is.
     """
 
-    def __init__(self, response):
+    def __init__(self, response, auto_decompressed=False):
         self._response = response
         self._raw_content = None
+        self._auto_decompressed = auto_decompressed
 
     def _is_compressed(self):
         headers = self._response.headers
@@ -80,7 +82,7 @@ class _CombinedResponse(transport.Response):
     async def content(self):
         # Load raw_content if necessary
         await self.raw_content()
-        if self._is_compressed():
+        if self._is_compressed() and not self._auto_decompressed:
             decoder = urllib3.response.MultiDecoder(
                 self._response.headers["Content-Encoding"]
             )
@@ -114,6 +116,22 @@ class _Response(transport.Response):
         return self._response.content
 
 
+def _session_auto_decompresses(session):
+    """Checks whether an aiohttp session decodes compressed response bodies.
+
+    Args:
+        session (aiohttp.ClientSession): The session to check.
+
+    Returns:
+        bool: True if the session was created with ``auto_decompress=True``.
+    """
+    auto_decompress = getattr(session, "auto_decompress", None)
+    if auto_decompress is None:  # pragma: NO COVER
+        # aiohttp < 3.8 only exposes the private attribute.
+        auto_decompress = getattr(session, "_auto_decompress", False)
+    return auto_decompress is True
+
+
 class Request(transport.Request):
     """Requests request adapter.
 
@@ -138,7 +156,7 @@ class Request(transport.Request):
     """
 
     def __init__(self, session=None):
-        self.session = None
+        self.session = session
 
     async def __call__(
         self,
@@ -174,23 +192,25 @@ class Request(transport.Request):
         """
 
         try:
-            if self.session is None:  # pragma: NO COVER
-                self.session = aiohttp.ClientSession(
-                    auto_decompress=False
-                )  # pragma: NO COVER
+            if self.session is None:
+                # Created lazily so the session is bound to the running event
+                # loop; it is then reused by subsequent calls.
+                self.session = aiohttp.ClientSession(auto_decompress=False)
             requests._LOGGER.debug("Making request: %s %s", method, url)
             response = await self.session.request(
                 method, url, data=body, headers=headers, timeout=timeout, **kwargs
             )
-            return _CombinedResponse(response)
+            return _CombinedResponse(
+                response, auto_decompressed=_session_auto_decompresses(self.session)
+            )
 
         except aiohttp.ClientError as caught_exc:
             new_exc = exceptions.TransportError(caught_exc)
-            six.raise_from(new_exc, caught_exc)
+            raise new_exc from caught_exc
 
         except asyncio.TimeoutError as caught_exc:
             new_exc = exceptions.TransportError(caught_exc)
-            six.raise_from(new_exc, caught_exc)
+            raise new_exc from caught_exc
 
 
 class AuthorizedSession(aiohttp.ClientSession):
@@ -249,6 +269,12 @@ class AuthorizedSession(aiohttp.ClientSession):
         self._auth_request_session = None
         self._loop = asyncio.get_event_loop()
         self._refresh_lock = asyncio.Lock()
+        # Refreshes are serialized by the lock above, so a single worker is
+        # enough; a dedicated executor keeps them from queueing behind other
+        # work submitted to the event loop's default executor.
+        self._refresh_executor = futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="google-auth-refresh"
+        )
         self._auto_decompress = auto_decompress
 
     async def request(
@@ -284,12 +310,8 @@ class AuthorizedSession(aiohttp.ClientSession):
                 value applies to the total method execution time, even if
                 multiple requests are made under the hood.
 
-                Mind that it is not guaranteed that the timeout error is raised
-                at ``max_allowed_time``. It might take longer, for example, if
-                an underlying request takes a lot of time, but the request
-                itself does not timeout, e.g. if a large file is being
-                transmitted. The timout error will be raised after such
-                request completes.
+                If the deadline is hit, the pending operation is cancelled
+                and :class:`asyncio.TimeoutError` is raised.
         """
         # Headers come in as bytes which isn't expected behavior, the resumable
         # media libraries in some cases expect a str type for the header values,
@@ -299,85 +321,93 @@ class AuthorizedSession(aiohttp.ClientSession):
                 if type(headers[key]) is bytes:
                     headers[key] = headers[key].decode("utf-8")
 
-        async with aiohttp.ClientSession(
-            auto_decompress=self._auto_decompress
-        ) as self._auth_request_session:
-            auth_request = Request(self._auth_request_session)
-            self._auth_request = auth_request
-
-            # Use a kwarg for this instead of an attribute to maintain
-            # thread-safety.
-            _credential_refresh_attempt = kwargs.pop("_credential_refresh_attempt", 0)
-            # Make a copy of the headers. They will be modified by the credentials
-            # and we want to pass the original headers if we recurse.
-            request_headers = headers.copy() if headers is not None else {}
-
-            # Do not apply the timeout unconditionally in order to not override the
-            # _auth_request's default timeout.
-            auth_request = (
-                self._auth_request
-                if timeout is None
-                else functools.partial(self._auth_request, timeout=timeout)
-            )
-
-            remaining_time = max_allowed_time
+        if self._auth_request is None:
+            # Create the session used for refreshing credentials once and
+            # reuse it, so its connections are pooled across requests.
+            # The refresh responses are decoded by _CombinedResponse, so the
+            # session must not decompress them as well.
+            self._auth_request_session = aiohttp.ClientSession(auto_decompress=False)
+            self._auth_request = Request(self._auth_request_session)
+
+        # Use a kwarg for this instead of an attribute to maintain
+        # thread-safety.
+        _credential_refresh_attempt = kwargs.pop("_credential_refresh_attempt", 0)
+        # Make a copy of the headers. They will be modified by the credentials
+        # and we want to pass the original headers if we recurse.
+        request_headers = headers.copy() if headers is not None else {}
+
+        # Do not apply the timeout unconditionally in order to not override the
+        # _auth_request's default timeout.
+        auth_request = (
+            self._auth_request
+            if timeout is None
+            else functools.partial(self._auth_request, timeout=timeout)
+        )
 
-            with requests.TimeoutGuard(remaining_time, asyncio.TimeoutError) as guard:
-                await self.credentials.before_request(
-                    auth_request, method, url, request_headers
-                )
+        deadline = (
+            None if max_allowed_time is None else self._loop.time() + max_allowed_time
+        )
 
-            with requests.TimeoutGuard(remaining_time, asyncio.TimeoutError) as guard:
-                response = await super(AuthorizedSession, self).request(
-                    method,
-                    url,
-                    data=data,
-                    headers=request_headers,
-                    timeout=timeout,
-                    **kwargs,
-                )
+        await asyncio.wait_for(
+            self.credentials.before_request(auth_request, method, url, request_headers),
+            timeout=self._remaining_time(deadline),
+        )
 
-            remaining_time = guard.remaining_timeout
+        response = await asyncio.wait_for(
+            super(AuthorizedSession, self).request(
+                method,
+                url,
+                data=data,
+                headers=request_headers,
+                timeout=timeout,
+                **kwargs,
+            ),
+            timeout=self._remaining_time(deadline),
+        )
 
-            if (
-                response.status in self._refresh_status_codes
-                and _credential_refresh_attempt < self._max_refresh_attempts
-            ):
+        if (
+            response.status in self._refresh_status_codes
+            and _credential_refresh_attempt < self._max_refresh_attempts
+        ):
 
-                requests._LOGGER.info(
-                    "Refreshing credentials due to a %s response. Attempt %s/%s.",
-                    response.status,
-                    _credential_refresh_attempt + 1,
-                    self._max_refresh_attempts,
-                )
+            requests._LOGGER.info(
+                "Refreshing credentials due to a %s response. Attempt %s/%s.",
+                response.status,
+                _credential_refresh_attempt + 1,
+                self._max_refresh_attempts,
+            )
 
-                # Do not apply the timeout unconditionally in order to not override the
-                # _auth_request's default timeout.
-                auth_request = (
-                    self._auth_request
-                    if timeout is None
-                    else functools.partial(self._auth_request, timeout=timeout)
+            async with self._refresh_lock:
+                await asyncio.wait_for(
+                    self._loop.run_in_executor(
+                        self._refresh_executor, self.credentials.refresh, auth_request
+                    ),
+                    timeout=self._remaining_time(deadline),
                 )
 
-                with requests.TimeoutGuard(
-                    remaining_time, asyncio.TimeoutError
-                ) as guard:
-                    async with self._refresh_lock:
-                        await self._loop.run_in_executor(
-                            None, self.credentials.refresh, auth_request
-                        )
-
-                remaining_time = guard.remaining_timeout
-
-                return await self.request(
-                    method,
-                    url,
-                    data=data,
-                    headers=headers,
-                    max_allowed_time=remaining_time,
-                    timeout=timeout,
-                    _credential_refresh_attempt=_credential_refresh_attempt + 1,
-                    **kwargs,
-                )
+            return await self.request(
+                method,
+                url,
+                data=data,
+                headers=headers,
+                max_allowed_time=self._remaining_time(deadline),
+                timeout=timeout,
+                _credential_refresh_attempt=_credential_refresh_attempt + 1,
+                **kwargs,
+            )
 
         return response
+
+    def _remaining_time(self, deadline):
+        """Returns the number of seconds left before ``deadline``, if any."""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self._loop.time())
+
+    async def close(self):
+        """Close this session and the session used to refresh credentials."""
+        if self._auth_request_session is not None:
+            await self._auth_request_session.close()
+            self._auth_request_session = None
+        self._refresh_executor.shutdown(wait=False)
+        await super(AuthorizedSession, self).close()
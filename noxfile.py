@@ -18,7 +18,6 @@ import nox
 
 TEST_DEPENDENCIES = [
     "flask",
-    "freezegun",
     "mock",
     "oauth2client",
     "pyopenssl",
@@ -356,6 +356,28 @@ def test_get_service_account_token_with_scopes_string(utcnow):
     assert expiry == utcnow() + datetime.timedelta(seconds=ttl)
 
 
+@mock.patch("google.auth._helpers.utcnow", return_value=datetime.datetime.min)
+def test_get_service_account_token_with_email(utcnow):
+    ttl = 500
+    request = make_request(
+        json.dumps({"access_token": "token", "expires_in": ttl}),
+        headers={"content-type": "application/json"},
+    )
+
+    token, expiry = _metadata.get_service_account_token(
+        request, service_account="foo@example.com"
+    )
+
+    request.assert_called_once_with(
+        method="GET",
+        url=_metadata._METADATA_ROOT
+        + "instance/service-accounts/foo@example.com/token",
+        headers=_metadata._METADATA_HEADERS,
+    )
+    assert token == "token"
+    assert expiry == utcnow() + datetime.timedelta(seconds=ttl)
+
+
 def test_get_service_account_info():
     key, value = "foo", "bar"
     request = make_request(
@@ -371,3 +393,23 @@ def test_get_service_account_info():
     )
 
     assert info[key] == value
+
+
+def test_get_service_account_info_with_email():
+    key, value = "foo", "bar"
+    request = make_request(
+        json.dumps({key: value}), headers={"content-type": "application/json"}
+    )
+
+    info = _metadata.get_service_account_info(
+        request, service_account="foo@example.com"
+    )
+
+    request.assert_called_once_with(
+        method="GET",
+        url=_metadata._METADATA_ROOT
+        + "instance/service-accounts/foo@example.com/?recursive=true",
+        headers=_metadata._METADATA_HEADERS,
+    )
+
+    assert info[key] == value
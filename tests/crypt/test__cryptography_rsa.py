@@ -107,6 +107,21 @@ class TestRSAVerifier(object):
 
 
 class TestRSASigner(object):
+    def test_sign_with_prefix(self):
+        signer = _cryptography_rsa.RSASigner.from_string(PRIVATE_KEY_BYTES)
+
+        assert signer.sign_with_prefix(b"header.", b"payload") == signer.sign(
+            b"header.payload"
+        )
+        # The cached prefix state is reused for the same prefix.
+        assert signer.sign_with_prefix(u"header.", u"other") == signer.sign(
+            b"header.other"
+        )
+        # And replaced when the prefix changes.
+        assert signer.sign_with_prefix(b"other.", b"payload") == signer.sign(
+            b"other.payload"
+        )
+
     def test_from_string_pkcs1(self):
         signer = _cryptography_rsa.RSASigner.from_string(PKCS1_KEY_BYTES)
         assert isinstance(signer, _cryptography_rsa.RSASigner)
@@ -129,6 +144,12 @@ class TestRSASigner(object):
         assert isinstance(signer, _cryptography_rsa.RSASigner)
         assert isinstance(signer._key, rsa.RSAPrivateKey)
 
+    def test_from_string_reuses_parsed_key(self):
+        signer = _cryptography_rsa.RSASigner.from_string(PKCS1_KEY_BYTES)
+        key_string = _helpers.from_bytes(PKCS1_KEY_BYTES)
+        other_signer = _cryptography_rsa.RSASigner.from_string(key_string)
+        assert other_signer._key is signer._key
+
     def test_from_string_pkcs12(self):
         with pytest.raises(ValueError):
             _cryptography_rsa.RSASigner.from_string(PKCS12_KEY_BYTES)
@@ -122,6 +122,16 @@ class TestRSAVerifier(object):
 
 
 class TestRSASigner(object):
+    def test_sign_with_prefix(self):
+        signer = _python_rsa.RSASigner.from_string(PKCS1_KEY_BYTES)
+
+        assert signer.sign_with_prefix(b"header.", b"payload") == signer.sign(
+            b"header.payload"
+        )
+        assert signer.sign_with_prefix(u"header.", u"other") == signer.sign(
+            b"header.other"
+        )
+
     def test_from_string_pkcs1(self):
         signer = _python_rsa.RSASigner.from_string(PKCS1_KEY_BYTES)
         assert isinstance(signer, _python_rsa.RSASigner)
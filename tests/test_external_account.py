@@ -23,14 +23,69 @@ from six.moves import urllib
 from google.auth import _helpers
 from google.auth import exceptions
 from google.auth import external_account
-from google.auth import transport
+
+try:
+    # Prefer orjson's faster serializer when it is installed.
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: NO COVER
+
+    def _dumps(data):
+        return json.dumps(data).encode("utf-8")
 
 
 CLIENT_ID = "username"
 CLIENT_SECRET = "password"
 # Base64 encoding of "username:password"
 BASIC_AUTH_ENCODING = "dXNlcm5hbWU6cGFzc3dvcmQ="
+BASIC_AUTH_HEADER = "Basic " + BASIC_AUTH_ENCODING
 SERVICE_ACCOUNT_EMAIL = "service-1234@service-name.iam.gserviceaccount.com"
+# Durations shared by the expiry tests.
+ONE_SECOND = datetime.timedelta(seconds=1)
+ONE_HOUR = datetime.timedelta(seconds=3600)
+# Custom token lifetime used to confirm the expiry is derived from the response.
+CUSTOM_LIFETIME = datetime.timedelta(seconds=2800)
+# Current time used by tests that freeze the clock with the frozen_utcnow
+# fixture.
+NOW = datetime.datetime(2021, 1, 1, 12, 0, 0)
+# Service account access token expiring 2800 seconds after NOW.
+EXPECTED_EXPIRY = NOW + CUSTOM_LIFETIME
+EXPIRE_TIME = EXPECTED_EXPIRY.isoformat("T") + "Z"
+
+
+def encode_json(data):
+    """Serializes a mock response body."""
+    return _dumps(data)
+
+
+class MockResponse(object):
+    """A lightweight stand-in for google.auth.transport.Response exposing only
+    the attributes the credentials read."""
+
+    __slots__ = ("status", "data")
+
+    def __init__(self, status, data):
+        self.status = status
+        self.data = data
+
+
+class RecordingRequest(object):
+    """A google.auth.transport.Request stand-in that returns the given
+    responses in order and records the keyword arguments of each call."""
+
+    __slots__ = ("responses", "call_args_list")
+
+    def __init__(self, responses):
+        self.responses = iter(responses)
+        # Calls are stored as (args, kwargs) like mock.Mock.call_args_list.
+        self.call_args_list = []
+
+    def __call__(self, **kwargs):
+        self.call_args_list.append(((), kwargs))
+        return next(self.responses)
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1]
 
 
 class CredentialsImpl(external_account.Credentials):
@@ -79,6 +134,19 @@ class TestCredentials(object):
     ).format(PROJECT_NUMBER, POOL_ID, PROVIDER_ID)
     SUBJECT_TOKEN_TYPE = "urn:ietf:params:oauth:token-type:jwt"
     CREDENTIAL_SOURCE = {"file": "/var/run/secrets/goog.id/token"}
+    TOKEN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+    # Expected STS token exchange request bodies.
+    TOKEN_REQUEST_DATA = {
+        "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
+        "audience": AUDIENCE,
+        "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
+        "subject_token": "subject_token_0",
+        "subject_token_type": SUBJECT_TOKEN_TYPE,
+    }
+    SCOPED_TOKEN_REQUEST_DATA = dict(TOKEN_REQUEST_DATA, scope="scope1 scope2")
+    IMPERSONATION_TOKEN_REQUEST_DATA = dict(
+        TOKEN_REQUEST_DATA, scope="https://www.googleapis.com/auth/iam"
+    )
     SUCCESS_RESPONSE = {
         "access_token": "ACCESS_TOKEN",
         "issued_token_type": "urn:ietf:params:oauth:token-type:access_token",
@@ -86,6 +154,7 @@ class TestCredentials(object):
         "expires_in": 3600,
         "scope": "scope1 scope2",
     }
+    BEARER_ACCESS_TOKEN = "Bearer " + SUCCESS_RESPONSE["access_token"]
     ERROR_RESPONSE = {
         "error": "invalid_request",
         "error_description": "Invalid subject token",
@@ -97,6 +166,16 @@ class TestCredentials(object):
         + "/serviceAccounts/{}:generateAccessToken".format(SERVICE_ACCOUNT_EMAIL)
     )
     SCOPES = ["scope1", "scope2"]
+    # Expected service account impersonation request headers and body.
+    IMPERSONATION_HEADERS = {
+        "Content-Type": "application/json",
+        "authorization": BEARER_ACCESS_TOKEN,
+    }
+    IMPERSONATION_REQUEST_DATA = {
+        "delegates": None,
+        "scope": SCOPES,
+        "lifetime": "3600s",
+    }
     IMPERSONATION_ERROR_RESPONSE = {
         "error": {
             "code": 400,
@@ -116,6 +195,9 @@ class TestCredentials(object):
         "createTime": "2018-11-06T04:42:54.109Z",
         "parent": {"type": "folder", "id": "12345678901"},
     }
+    # One second more than datetime.min plus the clock skew accommodation, so
+    # credentials expiring then are valid at datetime.min.
+    VALID_EXPIRY_FROM_MIN = datetime.datetime.min + _helpers.CLOCK_SKEW + ONE_SECOND
 
     @classmethod
     def make_credentials(
@@ -151,67 +233,63 @@ class TestCredentials(object):
         cloud_resource_manager_data=None,
     ):
         # STS token exchange request.
-        token_response = mock.create_autospec(transport.Response, instance=True)
-        token_response.status = status
-        token_response.data = json.dumps(data).encode("utf-8")
-        responses = [token_response]
-
+        specs = [(status, data)]
         # If service account impersonation is requested, mock the expected response.
         if impersonation_status:
-            impersonation_response = mock.create_autospec(
-                transport.Response, instance=True
-            )
-            impersonation_response.status = impersonation_status
-            impersonation_response.data = json.dumps(impersonation_data).encode("utf-8")
-            responses.append(impersonation_response)
-
+            specs.append((impersonation_status, impersonation_data))
         # If cloud resource manager is requested, mock the expected response.
         if cloud_resource_manager_status:
-            cloud_resource_manager_response = mock.create_autospec(
-                transport.Response, instance=True
-            )
-            cloud_resource_manager_response.status = cloud_resource_manager_status
-            cloud_resource_manager_response.data = json.dumps(
-                cloud_resource_manager_data
-            ).encode("utf-8")
-            responses.append(cloud_resource_manager_response)
-
-        request = mock.create_autospec(transport.Request)
-        request.side_effect = responses
+            specs.append((cloud_resource_manager_status, cloud_resource_manager_data))
 
-        return request
+        return RecordingRequest(
+            [
+                MockResponse(spec_status, encode_json(spec_data))
+                for spec_status, spec_data in specs
+            ]
+        )
 
     @classmethod
     def assert_token_request_kwargs(cls, request_kwargs, headers, request_data):
-        assert request_kwargs["url"] == cls.TOKEN_URL
-        assert request_kwargs["method"] == "POST"
-        assert request_kwargs["headers"] == headers
-        assert request_kwargs["body"] is not None
-        body_tuples = urllib.parse.parse_qsl(request_kwargs["body"])
-        for (k, v) in body_tuples:
-            assert v.decode("utf-8") == request_data[k.decode("utf-8")]
-        assert len(body_tuples) == len(request_data.keys())
+        body = dict(urllib.parse.parse_qsl(request_kwargs["body"].decode("utf-8")))
+        assert dict(request_kwargs, body=body) == {
+            "url": cls.TOKEN_URL,
+            "method": "POST",
+            "headers": headers,
+            "body": request_data,
+        }
 
     @classmethod
     def assert_impersonation_request_kwargs(cls, request_kwargs, headers, request_data):
-        assert request_kwargs["url"] == cls.SERVICE_ACCOUNT_IMPERSONATION_URL
-        assert request_kwargs["method"] == "POST"
-        assert request_kwargs["headers"] == headers
-        assert request_kwargs["body"] is not None
-        body_json = json.loads(request_kwargs["body"].decode("utf-8"))
-        assert body_json == request_data
+        body = json.loads(request_kwargs["body"].decode("utf-8"))
+        assert dict(request_kwargs, body=body) == {
+            "url": cls.SERVICE_ACCOUNT_IMPERSONATION_URL,
+            "method": "POST",
+            "headers": headers,
+            "body": request_data,
+        }
 
     @classmethod
     def assert_resource_manager_request_kwargs(
         cls, request_kwargs, project_number, headers
     ):
-        assert request_kwargs["url"] == cls.CLOUD_RESOURCE_MANAGER_URL + project_number
-        assert request_kwargs["method"] == "GET"
-        assert request_kwargs["headers"] == headers
-        assert "body" not in request_kwargs
+        assert request_kwargs == {
+            "url": cls.CLOUD_RESOURCE_MANAGER_URL + project_number,
+            "method": "GET",
+            "headers": headers,
+        }
 
-    def test_default_state(self):
-        credentials = self.make_credentials()
+    @pytest.fixture
+    def frozen_utcnow(self, monkeypatch):
+        monkeypatch.setattr(_helpers, "utcnow", lambda: NOW)
+
+    @pytest.fixture(scope="class")
+    def default_credentials(self):
+        # Shared by tests that only read from the credentials or derive new
+        # credentials from them.
+        return self.make_credentials()
+
+    def test_default_state(self, default_credentials):
+        credentials = default_credentials
 
         # Not token acquired yet
         assert not credentials.token
@@ -224,8 +302,8 @@ class TestCredentials(object):
         assert credentials.requires_scopes
         assert not credentials.quota_project_id
 
-    def test_with_scopes(self):
-        credentials = self.make_credentials()
+    def test_with_scopes(self, default_credentials):
+        credentials = default_credentials
 
         assert not credentials.scopes
         assert credentials.requires_scopes
@@ -235,8 +313,8 @@ class TestCredentials(object):
         assert scoped_credentials.has_scopes(["email"])
         assert not scoped_credentials.requires_scopes
 
-    def test_with_scopes_using_user_and_default_scopes(self):
-        credentials = self.make_credentials()
+    def test_with_scopes_using_user_and_default_scopes(self, default_credentials):
+        credentials = default_credentials
 
         assert not credentials.scopes
         assert credentials.requires_scopes
@@ -251,8 +329,8 @@ class TestCredentials(object):
         assert scoped_credentials.scopes == ["email"]
         assert scoped_credentials.default_scopes == ["profile"]
 
-    def test_with_scopes_using_default_scopes_only(self):
-        credentials = self.make_credentials()
+    def test_with_scopes_using_default_scopes_only(self, default_credentials):
+        credentials = default_credentials
 
         assert not credentials.scopes
         assert credentials.requires_scopes
@@ -292,8 +370,8 @@ class TestCredentials(object):
             default_scopes=["default2"],
         )
 
-    def test_with_quota_project(self):
-        credentials = self.make_credentials()
+    def test_with_quota_project(self, default_credentials):
+        credentials = default_credentials
 
         assert not credentials.scopes
         assert not credentials.quota_project_id
@@ -342,22 +420,14 @@ class TestCredentials(object):
             r"Unable to determine target principal from service account impersonation URL."
         )
 
-    @mock.patch("google.auth._helpers.utcnow", return_value=datetime.datetime.min)
-    def test_refresh_without_client_auth_success(self, unused_utcnow):
+    def test_refresh_without_client_auth_success(self, monkeypatch):
+        monkeypatch.setattr(_helpers, "utcnow", lambda: datetime.datetime.min)
         response = self.SUCCESS_RESPONSE.copy()
         # Test custom expiration to confirm expiry is set correctly.
         response["expires_in"] = 2800
-        expected_expiry = datetime.datetime.min + datetime.timedelta(
-            seconds=response["expires_in"]
-        )
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-        }
+        expected_expiry = datetime.datetime.min + CUSTOM_LIFETIME
+        headers = self.TOKEN_HEADERS
+        request_data = self.TOKEN_REQUEST_DATA
         request = self.make_mock_request(status=http_client.OK, data=response)
         credentials = self.make_credentials()
 
@@ -369,82 +439,73 @@ class TestCredentials(object):
         assert not credentials.expired
         assert credentials.token == response["access_token"]
 
-    def test_refresh_impersonation_without_client_auth_success(self):
-        # Simulate service account access token expires in 2800 seconds.
-        expire_time = (
-            _helpers.utcnow().replace(microsecond=0) + datetime.timedelta(seconds=2800)
-        ).isoformat("T") + "Z"
-        expected_expiry = datetime.datetime.strptime(expire_time, "%Y-%m-%dT%H:%M:%SZ")
-        # STS token exchange request/response.
-        token_response = self.SUCCESS_RESPONSE.copy()
-        token_headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        token_request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-            "scope": "https://www.googleapis.com/auth/iam",
-        }
-        # Service account impersonation request/response.
-        impersonation_response = {
-            "accessToken": "SA_ACCESS_TOKEN",
-            "expireTime": expire_time,
-        }
-        impersonation_headers = {
-            "Content-Type": "application/json",
-            "authorization": "Bearer {}".format(token_response["access_token"]),
-        }
-        impersonation_request_data = {
-            "delegates": None,
-            "scope": self.SCOPES,
-            "lifetime": "3600s",
-        }
-        # Initialize mock request to handle token exchange and service account
-        # impersonation request.
-        request = self.make_mock_request(
-            status=http_client.OK,
-            data=token_response,
-            impersonation_status=http_client.OK,
-            impersonation_data=impersonation_response,
-        )
-        # Initialize credentials with service account impersonation.
-        credentials = self.make_credentials(
-            service_account_impersonation_url=self.SERVICE_ACCOUNT_IMPERSONATION_URL,
-            scopes=self.SCOPES,
-        )
+    @pytest.mark.parametrize(
+        "client_auth,impersonation",
+        [(False, False), (True, False), (False, True), (True, True)],
+    )
+    @pytest.mark.usefixtures("frozen_utcnow")
+    def test_refresh_success(self, client_auth, impersonation):
+        token_headers = dict(self.TOKEN_HEADERS)
+        token_request_data = self.TOKEN_REQUEST_DATA
+        credentials_kwargs = {}
+        if client_auth:
+            token_headers["Authorization"] = BASIC_AUTH_HEADER
+            credentials_kwargs.update(client_id=CLIENT_ID, client_secret=CLIENT_SECRET)
+
+        if impersonation:
+            token_request_data = self.IMPERSONATION_TOKEN_REQUEST_DATA
+            # Service account impersonation request/response.
+            impersonation_response = {
+                "accessToken": "SA_ACCESS_TOKEN",
+                "expireTime": EXPIRE_TIME,
+            }
+            request = self.make_mock_request(
+                status=http_client.OK,
+                data=self.SUCCESS_RESPONSE,
+                impersonation_status=http_client.OK,
+                impersonation_data=impersonation_response,
+            )
+            credentials_kwargs.update(
+                service_account_impersonation_url=self.SERVICE_ACCOUNT_IMPERSONATION_URL,
+                scopes=self.SCOPES,
+                # Default scopes will be ignored since user scopes are specified.
+                default_scopes=["ignored"],
+            )
+            expected_token = impersonation_response["accessToken"]
+        else:
+            request = self.make_mock_request(
+                status=http_client.OK, data=self.SUCCESS_RESPONSE
+            )
+            expected_token = self.SUCCESS_RESPONSE["access_token"]
+        credentials = self.make_credentials(**credentials_kwargs)
 
         credentials.refresh(request)
 
-        # Only 2 requests should be processed.
-        assert len(request.call_args_list) == 2
         # Verify token exchange request parameters.
         self.assert_token_request_kwargs(
             request.call_args_list[0][1], token_headers, token_request_data
         )
-        # Verify service account impersonation request parameters.
-        self.assert_impersonation_request_kwargs(
-            request.call_args_list[1][1],
-            impersonation_headers,
-            impersonation_request_data,
-        )
+        if impersonation:
+            # Only 2 requests should be processed.
+            assert len(request.call_args_list) == 2
+            # Verify service account impersonation request parameters.
+            self.assert_impersonation_request_kwargs(
+                request.call_args_list[1][1],
+                self.IMPERSONATION_HEADERS,
+                self.IMPERSONATION_REQUEST_DATA,
+            )
+            assert credentials.expiry == EXPECTED_EXPIRY
+        else:
+            assert len(request.call_args_list) == 1
         assert credentials.valid
-        assert credentials.expiry == expected_expiry
         assert not credentials.expired
-        assert credentials.token == impersonation_response["accessToken"]
+        assert credentials.token == expected_token
 
     def test_refresh_without_client_auth_success_explicit_user_scopes_ignore_default_scopes(
         self,
     ):
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "scope": "scope1 scope2",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-        }
+        headers = self.TOKEN_HEADERS
+        request_data = self.SCOPED_TOKEN_REQUEST_DATA
         request = self.make_mock_request(
             status=http_client.OK, data=self.SUCCESS_RESPONSE
         )
@@ -464,15 +525,8 @@ class TestCredentials(object):
         assert not credentials.has_scopes(["ignored"])
 
     def test_refresh_without_client_auth_success_explicit_default_scopes_only(self):
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "scope": "scope1 scope2",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-        }
+        headers = self.TOKEN_HEADERS
+        request_data = self.SCOPED_TOKEN_REQUEST_DATA
         request = self.make_mock_request(
             status=http_client.OK, data=self.SUCCESS_RESPONSE
         )
@@ -524,142 +578,24 @@ class TestCredentials(object):
         assert not credentials.expired
         assert credentials.token is None
 
-    def test_refresh_with_client_auth_success(self):
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": "Basic {}".format(BASIC_AUTH_ENCODING),
-        }
-        request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-        }
-        request = self.make_mock_request(
-            status=http_client.OK, data=self.SUCCESS_RESPONSE
-        )
-        credentials = self.make_credentials(
-            client_id=CLIENT_ID, client_secret=CLIENT_SECRET
-        )
-
-        credentials.refresh(request)
-
-        self.assert_token_request_kwargs(request.call_args[1], headers, request_data)
-        assert credentials.valid
-        assert not credentials.expired
-        assert credentials.token == self.SUCCESS_RESPONSE["access_token"]
-
-    def test_refresh_impersonation_with_client_auth_success_ignore_default_scopes(self):
-        # Simulate service account access token expires in 2800 seconds.
-        expire_time = (
-            _helpers.utcnow().replace(microsecond=0) + datetime.timedelta(seconds=2800)
-        ).isoformat("T") + "Z"
-        expected_expiry = datetime.datetime.strptime(expire_time, "%Y-%m-%dT%H:%M:%SZ")
-        # STS token exchange request/response.
-        token_response = self.SUCCESS_RESPONSE.copy()
-        token_headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": "Basic {}".format(BASIC_AUTH_ENCODING),
-        }
-        token_request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-            "scope": "https://www.googleapis.com/auth/iam",
-        }
-        # Service account impersonation request/response.
-        impersonation_response = {
-            "accessToken": "SA_ACCESS_TOKEN",
-            "expireTime": expire_time,
-        }
-        impersonation_headers = {
-            "Content-Type": "application/json",
-            "authorization": "Bearer {}".format(token_response["access_token"]),
-        }
-        impersonation_request_data = {
-            "delegates": None,
-            "scope": self.SCOPES,
-            "lifetime": "3600s",
-        }
-        # Initialize mock request to handle token exchange and service account
-        # impersonation request.
-        request = self.make_mock_request(
-            status=http_client.OK,
-            data=token_response,
-            impersonation_status=http_client.OK,
-            impersonation_data=impersonation_response,
-        )
-        # Initialize credentials with service account impersonation and basic auth.
-        credentials = self.make_credentials(
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            service_account_impersonation_url=self.SERVICE_ACCOUNT_IMPERSONATION_URL,
-            scopes=self.SCOPES,
-            # Default scopes will be ignored since user scopes are specified.
-            default_scopes=["ignored"],
-        )
-
-        credentials.refresh(request)
-
-        # Only 2 requests should be processed.
-        assert len(request.call_args_list) == 2
-        # Verify token exchange request parameters.
-        self.assert_token_request_kwargs(
-            request.call_args_list[0][1], token_headers, token_request_data
-        )
-        # Verify service account impersonation request parameters.
-        self.assert_impersonation_request_kwargs(
-            request.call_args_list[1][1],
-            impersonation_headers,
-            impersonation_request_data,
-        )
-        assert credentials.valid
-        assert credentials.expiry == expected_expiry
-        assert not credentials.expired
-        assert credentials.token == impersonation_response["accessToken"]
-
+    @pytest.mark.usefixtures("frozen_utcnow")
     def test_refresh_impersonation_with_client_auth_success_use_default_scopes(self):
-        # Simulate service account access token expires in 2800 seconds.
-        expire_time = (
-            _helpers.utcnow().replace(microsecond=0) + datetime.timedelta(seconds=2800)
-        ).isoformat("T") + "Z"
-        expected_expiry = datetime.datetime.strptime(expire_time, "%Y-%m-%dT%H:%M:%SZ")
         # STS token exchange request/response.
-        token_response = self.SUCCESS_RESPONSE.copy()
         token_headers = {
             "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": "Basic {}".format(BASIC_AUTH_ENCODING),
-        }
-        token_request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-            "scope": "https://www.googleapis.com/auth/iam",
+            "Authorization": BASIC_AUTH_HEADER,
         }
+        token_request_data = self.IMPERSONATION_TOKEN_REQUEST_DATA
         # Service account impersonation request/response.
         impersonation_response = {
             "accessToken": "SA_ACCESS_TOKEN",
-            "expireTime": expire_time,
-        }
-        impersonation_headers = {
-            "Content-Type": "application/json",
-            "authorization": "Bearer {}".format(token_response["access_token"]),
-        }
-        impersonation_request_data = {
-            "delegates": None,
-            "scope": self.SCOPES,
-            "lifetime": "3600s",
+            "expireTime": EXPIRE_TIME,
         }
         # Initialize mock request to handle token exchange and service account
         # impersonation request.
         request = self.make_mock_request(
             status=http_client.OK,
-            data=token_response,
+            data=self.SUCCESS_RESPONSE,
             impersonation_status=http_client.OK,
             impersonation_data=impersonation_response,
         )
@@ -684,108 +620,60 @@ class TestCredentials(object):
         # Verify service account impersonation request parameters.
         self.assert_impersonation_request_kwargs(
             request.call_args_list[1][1],
-            impersonation_headers,
-            impersonation_request_data,
+            self.IMPERSONATION_HEADERS,
+            self.IMPERSONATION_REQUEST_DATA,
         )
         assert credentials.valid
-        assert credentials.expiry == expected_expiry
+        assert credentials.expiry == EXPECTED_EXPIRY
         assert not credentials.expired
         assert credentials.token == impersonation_response["accessToken"]
 
-    def test_apply_without_quota_project_id(self):
-        headers = {}
-        request = self.make_mock_request(
-            status=http_client.OK, data=self.SUCCESS_RESPONSE
-        )
-        credentials = self.make_credentials()
-
-        credentials.refresh(request)
-        credentials.apply(headers)
-
-        assert headers == {
-            "authorization": "Bearer {}".format(self.SUCCESS_RESPONSE["access_token"])
-        }
-
-    def test_apply_impersonation_without_quota_project_id(self):
-        expire_time = (
-            _helpers.utcnow().replace(microsecond=0) + datetime.timedelta(seconds=3600)
-        ).isoformat("T") + "Z"
-        # Service account impersonation response.
-        impersonation_response = {
-            "accessToken": "SA_ACCESS_TOKEN",
-            "expireTime": expire_time,
-        }
-        # Initialize mock request to handle token exchange and service account
-        # impersonation request.
-        request = self.make_mock_request(
-            status=http_client.OK,
-            data=self.SUCCESS_RESPONSE.copy(),
-            impersonation_status=http_client.OK,
-            impersonation_data=impersonation_response,
-        )
-        # Initialize credentials with service account impersonation.
-        credentials = self.make_credentials(
-            service_account_impersonation_url=self.SERVICE_ACCOUNT_IMPERSONATION_URL,
-            scopes=self.SCOPES,
-        )
-        headers = {}
-
-        credentials.refresh(request)
-        credentials.apply(headers)
-
-        assert headers == {
-            "authorization": "Bearer {}".format(impersonation_response["accessToken"])
-        }
-
-    def test_apply_with_quota_project_id(self):
-        headers = {"other": "header-value"}
-        request = self.make_mock_request(
-            status=http_client.OK, data=self.SUCCESS_RESPONSE
-        )
-        credentials = self.make_credentials(quota_project_id=self.QUOTA_PROJECT_ID)
-
-        credentials.refresh(request)
-        credentials.apply(headers)
-
-        assert headers == {
-            "other": "header-value",
-            "authorization": "Bearer {}".format(self.SUCCESS_RESPONSE["access_token"]),
-            "x-goog-user-project": self.QUOTA_PROJECT_ID,
-        }
-
-    def test_apply_impersonation_with_quota_project_id(self):
-        expire_time = (
-            _helpers.utcnow().replace(microsecond=0) + datetime.timedelta(seconds=3600)
-        ).isoformat("T") + "Z"
-        # Service account impersonation response.
-        impersonation_response = {
-            "accessToken": "SA_ACCESS_TOKEN",
-            "expireTime": expire_time,
-        }
-        # Initialize mock request to handle token exchange and service account
-        # impersonation request.
-        request = self.make_mock_request(
-            status=http_client.OK,
-            data=self.SUCCESS_RESPONSE.copy(),
-            impersonation_status=http_client.OK,
-            impersonation_data=impersonation_response,
-        )
-        # Initialize credentials with service account impersonation.
-        credentials = self.make_credentials(
-            service_account_impersonation_url=self.SERVICE_ACCOUNT_IMPERSONATION_URL,
-            scopes=self.SCOPES,
-            quota_project_id=self.QUOTA_PROJECT_ID,
-        )
+    @pytest.mark.parametrize(
+        "impersonation,quota_project",
+        [(False, False), (True, False), (False, True), (True, True)],
+    )
+    @pytest.mark.usefixtures("frozen_utcnow")
+    def test_apply(self, impersonation, quota_project):
+        credentials_kwargs = {}
+        if quota_project:
+            credentials_kwargs["quota_project_id"] = self.QUOTA_PROJECT_ID
+        if impersonation:
+            # Service account impersonation response.
+            impersonation_response = {
+                "accessToken": "SA_ACCESS_TOKEN",
+                "expireTime": EXPIRE_TIME,
+            }
+            # Initialize mock request to handle token exchange and service
+            # account impersonation request.
+            request = self.make_mock_request(
+                status=http_client.OK,
+                data=self.SUCCESS_RESPONSE,
+                impersonation_status=http_client.OK,
+                impersonation_data=impersonation_response,
+            )
+            credentials_kwargs.update(
+                service_account_impersonation_url=self.SERVICE_ACCOUNT_IMPERSONATION_URL,
+                scopes=self.SCOPES,
+            )
+            expected_token = impersonation_response["accessToken"]
+        else:
+            request = self.make_mock_request(
+                status=http_client.OK, data=self.SUCCESS_RESPONSE
+            )
+            expected_token = self.SUCCESS_RESPONSE["access_token"]
+        credentials = self.make_credentials(**credentials_kwargs)
         headers = {"other": "header-value"}
 
         credentials.refresh(request)
         credentials.apply(headers)
 
-        assert headers == {
+        expected_headers = {
             "other": "header-value",
-            "authorization": "Bearer {}".format(impersonation_response["accessToken"]),
-            "x-goog-user-project": self.QUOTA_PROJECT_ID,
+            "authorization": "Bearer {}".format(expected_token),
         }
+        if quota_project:
+            expected_headers["x-goog-user-project"] = self.QUOTA_PROJECT_ID
+        assert headers == expected_headers
 
     def test_before_request(self):
         headers = {"other": "header-value"}
@@ -799,7 +687,7 @@ class TestCredentials(object):
 
         assert headers == {
             "other": "header-value",
-            "authorization": "Bearer {}".format(self.SUCCESS_RESPONSE["access_token"]),
+            "authorization": self.BEARER_ACCESS_TOKEN,
         }
 
         # Second call shouldn't call refresh.
@@ -807,23 +695,21 @@ class TestCredentials(object):
 
         assert headers == {
             "other": "header-value",
-            "authorization": "Bearer {}".format(self.SUCCESS_RESPONSE["access_token"]),
+            "authorization": self.BEARER_ACCESS_TOKEN,
         }
 
+    @pytest.mark.usefixtures("frozen_utcnow")
     def test_before_request_impersonation(self):
-        expire_time = (
-            _helpers.utcnow().replace(microsecond=0) + datetime.timedelta(seconds=3600)
-        ).isoformat("T") + "Z"
         # Service account impersonation response.
         impersonation_response = {
             "accessToken": "SA_ACCESS_TOKEN",
-            "expireTime": expire_time,
+            "expireTime": EXPIRE_TIME,
         }
         # Initialize mock request to handle token exchange and service account
         # impersonation request.
         request = self.make_mock_request(
             status=http_client.OK,
-            data=self.SUCCESS_RESPONSE.copy(),
+            data=self.SUCCESS_RESPONSE,
             impersonation_status=http_client.OK,
             impersonation_data=impersonation_response,
         )
@@ -848,20 +734,18 @@ class TestCredentials(object):
             "authorization": "Bearer {}".format(impersonation_response["accessToken"]),
         }
 
-    @mock.patch("google.auth._helpers.utcnow")
-    def test_before_request_expired(self, utcnow):
+    def test_before_request_expired(self, monkeypatch):
+        now = [datetime.datetime.min]
+        monkeypatch.setattr(_helpers, "utcnow", lambda: now[0])
         headers = {}
         request = self.make_mock_request(
             status=http_client.OK, data=self.SUCCESS_RESPONSE
         )
         credentials = self.make_credentials()
         credentials.token = "token"
-        utcnow.return_value = datetime.datetime.min
         # Set the expiration to one second more than now plus the clock skew
         # accomodation. These credentials should be valid.
-        credentials.expiry = (
-            datetime.datetime.min + _helpers.CLOCK_SKEW + datetime.timedelta(seconds=1)
-        )
+        credentials.expiry = self.VALID_EXPIRY_FROM_MIN
 
         assert credentials.valid
         assert not credentials.expired
@@ -872,7 +756,7 @@ class TestCredentials(object):
         assert headers == {"authorization": "Bearer token"}
 
         # Next call should simulate 1 second passed.
-        utcnow.return_value = datetime.datetime.min + datetime.timedelta(seconds=1)
+        now[0] = datetime.datetime.min + ONE_SECOND
 
         assert not credentials.valid
         assert credentials.expired
@@ -880,16 +764,14 @@ class TestCredentials(object):
         credentials.before_request(request, "POST", "https://example.com/api", headers)
 
         # New token should be retrieved.
-        assert headers == {
-            "authorization": "Bearer {}".format(self.SUCCESS_RESPONSE["access_token"])
-        }
+        assert headers == {"authorization": self.BEARER_ACCESS_TOKEN}
 
-    @mock.patch("google.auth._helpers.utcnow")
-    def test_before_request_impersonation_expired(self, utcnow):
+    def test_before_request_impersonation_expired(self, monkeypatch):
+        now = [datetime.datetime.min]
+        monkeypatch.setattr(_helpers, "utcnow", lambda: now[0])
         headers = {}
-        expire_time = (
-            datetime.datetime.min + datetime.timedelta(seconds=3601)
-        ).isoformat("T") + "Z"
+        expiry = datetime.datetime.min + ONE_HOUR + ONE_SECOND
+        expire_time = expiry.isoformat("T") + "Z"
         # Service account impersonation response.
         impersonation_response = {
             "accessToken": "SA_ACCESS_TOKEN",
@@ -899,7 +781,7 @@ class TestCredentials(object):
         # impersonation request.
         request = self.make_mock_request(
             status=http_client.OK,
-            data=self.SUCCESS_RESPONSE.copy(),
+            data=self.SUCCESS_RESPONSE,
             impersonation_status=http_client.OK,
             impersonation_data=impersonation_response,
         )
@@ -907,12 +789,9 @@ class TestCredentials(object):
             service_account_impersonation_url=self.SERVICE_ACCOUNT_IMPERSONATION_URL
         )
         credentials.token = "token"
-        utcnow.return_value = datetime.datetime.min
         # Set the expiration to one second more than now plus the clock skew
         # accomodation. These credentials should be valid.
-        credentials.expiry = (
-            datetime.datetime.min + _helpers.CLOCK_SKEW + datetime.timedelta(seconds=1)
-        )
+        credentials.expiry = self.VALID_EXPIRY_FROM_MIN
 
         assert credentials.valid
         assert not credentials.expired
@@ -924,7 +803,7 @@ class TestCredentials(object):
 
         # Next call should simulate 1 second passed. This will trigger the expiration
         # threshold.
-        utcnow.return_value = datetime.datetime.min + datetime.timedelta(seconds=1)
+        now[0] = datetime.datetime.min + ONE_SECOND
 
         assert not credentials.valid
         assert credentials.expired
@@ -984,40 +863,22 @@ class TestCredentials(object):
 
     def test_get_project_id_cloud_resource_manager_success(self):
         # STS token exchange request/response.
-        token_response = self.SUCCESS_RESPONSE.copy()
-        token_headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        token_request_data = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "audience": self.AUDIENCE,
-            "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "subject_token": "subject_token_0",
-            "subject_token_type": self.SUBJECT_TOKEN_TYPE,
-            "scope": "https://www.googleapis.com/auth/iam",
-        }
+        token_headers = self.TOKEN_HEADERS
+        token_request_data = self.IMPERSONATION_TOKEN_REQUEST_DATA
         # Service account impersonation request/response.
-        expire_time = (
-            _helpers.utcnow().replace(microsecond=0) + datetime.timedelta(seconds=3600)
-        ).isoformat("T") + "Z"
-        expected_expiry = datetime.datetime.strptime(expire_time, "%Y-%m-%dT%H:%M:%SZ")
+        expected_expiry = _helpers.utcnow().replace(microsecond=0) + ONE_HOUR
+        expire_time = expected_expiry.isoformat("T") + "Z"
         impersonation_response = {
             "accessToken": "SA_ACCESS_TOKEN",
             "expireTime": expire_time,
         }
-        impersonation_headers = {
-            "Content-Type": "application/json",
-            "x-goog-user-project": self.QUOTA_PROJECT_ID,
-            "authorization": "Bearer {}".format(token_response["access_token"]),
-        }
-        impersonation_request_data = {
-            "delegates": None,
-            "scope": self.SCOPES,
-            "lifetime": "3600s",
-        }
+        impersonation_headers = dict(self.IMPERSONATION_HEADERS)
+        impersonation_headers["x-goog-user-project"] = self.QUOTA_PROJECT_ID
         # Initialize mock request to handle token exchange, service account
         # impersonation and cloud resource manager request.
         request = self.make_mock_request(
             status=http_client.OK,
-            data=self.SUCCESS_RESPONSE.copy(),
+            data=self.SUCCESS_RESPONSE,
             impersonation_status=http_client.OK,
             impersonation_data=impersonation_response,
             cloud_resource_manager_status=http_client.OK,
@@ -1033,17 +894,14 @@ class TestCredentials(object):
         project_id = credentials.get_project_id(request)
 
         assert project_id == self.PROJECT_ID
+        calls = request.call_args_list
         # 3 requests should be processed.
-        assert len(request.call_args_list) == 3
+        assert len(calls) == 3
         # Verify token exchange request parameters.
-        self.assert_token_request_kwargs(
-            request.call_args_list[0][1], token_headers, token_request_data
-        )
+        self.assert_token_request_kwargs(calls[0][1], token_headers, token_request_data)
         # Verify service account impersonation request parameters.
         self.assert_impersonation_request_kwargs(
-            request.call_args_list[1][1],
-            impersonation_headers,
-            impersonation_request_data,
+            calls[1][1], impersonation_headers, self.IMPERSONATION_REQUEST_DATA
         )
         # In the process of getting project ID, an access token should be
         # retrieved.
@@ -1053,7 +911,7 @@ class TestCredentials(object):
         assert credentials.token == impersonation_response["accessToken"]
         # Verify cloud resource manager request parameters.
         self.assert_resource_manager_request_kwargs(
-            request.call_args_list[2][1],
+            calls[2][1],
             self.PROJECT_NUMBER,
             {
                 "x-goog-user-project": self.QUOTA_PROJECT_ID,
@@ -1068,14 +926,14 @@ class TestCredentials(object):
 
         assert project_id == self.PROJECT_ID
         # No additional requests.
-        assert len(request.call_args_list) == 3
+        assert len(calls) == 3
 
     def test_get_project_id_cloud_resource_manager_error(self):
         # Simulate resource doesn't have sufficient permissions to access
         # cloud resource manager.
         request = self.make_mock_request(
             status=http_client.OK,
-            data=self.SUCCESS_RESPONSE.copy(),
+            data=self.SUCCESS_RESPONSE,
             cloud_resource_manager_status=http_client.UNAUTHORIZED,
         )
         credentials = self.make_credentials(scopes=self.SCOPES)
@@ -1085,3 +943,71 @@ class TestCredentials(object):
         assert project_id is None
         # Only 2 requests to STS and cloud resource manager should be sent.
         assert len(request.call_args_list) == 2
+
+    def test_get_project_id_cloud_resource_manager_error_cached(self, monkeypatch):
+        now = [datetime.datetime.min]
+        monkeypatch.setattr(_helpers, "utcnow", lambda: now[0])
+        request = self.make_mock_request(
+            status=http_client.OK,
+            data=self.SUCCESS_RESPONSE,
+            cloud_resource_manager_status=http_client.UNAUTHORIZED,
+        )
+        credentials = self.make_credentials(scopes=self.SCOPES)
+
+        assert credentials.get_project_id(request) is None
+        assert len(request.call_args_list) == 2
+
+        # The failure should be cached without sending any new request.
+        now[0] = datetime.datetime.min + external_account._PROJECT_ID_LOOKUP_FAILURE_TTL
+        now[0] -= ONE_SECOND
+
+        assert credentials.get_project_id(request) is None
+        assert len(request.call_args_list) == 2
+
+    def test_get_project_id_cloud_resource_manager_error_expired(self, monkeypatch):
+        now = [datetime.datetime.min]
+        monkeypatch.setattr(_helpers, "utcnow", lambda: now[0])
+        # Token exchange followed by a failed and a successful cloud resource
+        # manager lookup.
+        request = RecordingRequest(
+            [
+                MockResponse(http_client.OK, encode_json(self.SUCCESS_RESPONSE)),
+                MockResponse(http_client.UNAUTHORIZED, encode_json(None)),
+                MockResponse(
+                    http_client.OK,
+                    encode_json(self.CLOUD_RESOURCE_MANAGER_SUCCESS_RESPONSE),
+                ),
+            ]
+        )
+        credentials = self.make_credentials(scopes=self.SCOPES)
+
+        assert credentials.get_project_id(request) is None
+
+        # Once the failure expires, the lookup should be retried using the
+        # still valid access token.
+        now[0] = datetime.datetime.min + external_account._PROJECT_ID_LOOKUP_FAILURE_TTL
+
+        assert credentials.get_project_id(request) == self.PROJECT_ID
+        assert len(request.call_args_list) == 3
+
+    def test_clear_project_id_cache(self):
+        # Token exchange followed by a failed and a successful cloud resource
+        # manager lookup.
+        request = RecordingRequest(
+            [
+                MockResponse(http_client.OK, encode_json(self.SUCCESS_RESPONSE)),
+                MockResponse(http_client.UNAUTHORIZED, encode_json(None)),
+                MockResponse(
+                    http_client.OK,
+                    encode_json(self.CLOUD_RESOURCE_MANAGER_SUCCESS_RESPONSE),
+                ),
+            ]
+        )
+        credentials = self.make_credentials(scopes=self.SCOPES)
+
+        assert credentials.get_project_id(request) is None
+
+        credentials.clear_project_id_cache()
+
+        assert credentials.get_project_id(request) == self.PROJECT_ID
+        assert len(request.call_args_list) == 3
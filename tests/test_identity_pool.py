@@ -460,6 +460,38 @@ class TestCredentials(object):
 
         assert subject_token == JSON_FILE_SUBJECT_TOKEN
 
+    def test_retrieve_subject_token_file_cached(self, tmpdir):
+        token_file = tmpdir.join("token.txt")
+        token_file.write("token1")
+        credential_source = {"file": str(token_file)}
+        credentials = self.make_credentials(credential_source=credential_source)
+
+        assert credentials.retrieve_subject_token(None) == "token1"
+
+        with mock.patch("io.open", side_effect=AssertionError) as io_open:
+            with mock.patch.object(
+                identity_pool.Credentials, "_parse_token_data"
+            ) as parse_token_data:
+                assert credentials.retrieve_subject_token(None) == "token1"
+        io_open.assert_not_called()
+        parse_token_data.assert_not_called()
+
+    def test_retrieve_subject_token_file_modified(self, tmpdir):
+        token_file = tmpdir.join("token.txt")
+        token_file.write("token1")
+        credential_source = {"file": str(token_file)}
+        credentials = self.make_credentials(credential_source=credential_source)
+
+        assert credentials.retrieve_subject_token(None) == "token1"
+        mtime = os.stat(str(token_file)).st_mtime
+
+        # Keep the size unchanged and move the mtime explicitly, so that only
+        # the modification time tells the two contents apart.
+        token_file.write("token2")
+        os.utime(str(token_file), (mtime + 1, mtime + 1))
+
+        assert credentials.retrieve_subject_token(None) == "token2"
+
     def test_retrieve_subject_token_json_file_invalid_field_name(self):
         credential_source = {
             "file": SUBJECT_TOKEN_JSON_FILE,
@@ -17,7 +17,6 @@ import functools
 import os
 import sys
 
-import freezegun
 import mock
 import OpenSSL
 import pytest
@@ -34,10 +33,25 @@ from google.oauth2 import service_account
 from tests.transport import compliance
 
 
+class FrozenTime(object):
+    """Stand-in for the time module used by the requests transport whose
+    clock only advances when ticked."""
+
+    def __init__(self):
+        self._now = 0.0
+
+    def time(self):
+        return self._now
+
+    def tick(self, delta):
+        self._now += delta.total_seconds()
+
+
 @pytest.fixture
-def frozen_time():
-    with freezegun.freeze_time("1970-01-01 00:00:00", tick=False) as frozen:
-        yield frozen
+def frozen_time(monkeypatch):
+    frozen = FrozenTime()
+    monkeypatch.setattr(google.auth.transport.requests, "time", frozen)
+    return frozen
 
 
 class TestRequestResponse(compliance.RequestResponseTests):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import time
 
 import flask
@@ -43,6 +44,11 @@ class RequestResponseTests(object):
             headers = {"X-Test-Header": header_value}
             return "Basic Content", http_client.OK, headers
 
+        @app.route("/gzip")
+        def gzip_content():
+            headers = {"Content-Encoding": "gzip"}
+            return gzip.compress(b"Gzip Content"), http_client.OK, headers
+
         @app.route("/server_error")
         def server_error():
             return "Error", http_client.INTERNAL_SERVER_ERROR
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
+
 import aiohttp
 from aioresponses import aioresponses, core
 import mock
@@ -111,9 +114,54 @@ class TestRequestResponse(async_compliance.RequestResponseTests):
     def make_request(self):
         return aiohttp_requests.Request()
 
-    def make_with_parameter_request(self):
+    @pytest.mark.asyncio
+    async def test_request_basic_with_http(self, server):
+        # The session has to be created and closed on the test's event loop.
+        async with aiohttp.ClientSession() as http:
+            request = aiohttp_requests.Request(http)
+            response = await request(url=server.url + "/basic", method="GET")
+            assert response.status == 200
+            assert response.headers["x-test-header"] == "value"
+
+            data = await response.data.read(13)
+            assert data == b"Basic Content"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("auto_decompress", [True, False])
+    async def test_request_gzip_with_http(self, server, auto_decompress):
+        async with aiohttp.ClientSession(auto_decompress=auto_decompress) as http:
+            request = aiohttp_requests.Request(http)
+            response = await request(url=server.url + "/gzip", method="GET")
+
+            assert await response.content() == b"Gzip Content"
+
+    @pytest.mark.asyncio
+    async def test_request_gzip(self, server):
+        request = aiohttp_requests.Request()
+        response = await request(url=server.url + "/gzip", method="GET")
+
+        assert await response.content() == b"Gzip Content"
+        await request.session.close()
+
+    def test_ctor_with_session(self):
         http = mock.create_autospec(aiohttp.ClientSession, instance=True)
-        return aiohttp_requests.Request(http)
+        request = aiohttp_requests.Request(http)
+        assert request.session is http
+
+    @pytest.mark.asyncio
+    async def test_session_reused(self):
+        request = aiohttp_requests.Request()
+        with aioresponses() as mocked:
+            mocked.get("http://example.com", status=200)
+            mocked.get("http://example.com", status=200)
+
+            await request(url="http://example.com", method="GET")
+            session = request.session
+            await request(url="http://example.com", method="GET")
+
+            assert request.session is session
+
+        await session.close()
 
     def test_timeout(self):
         http = mock.create_autospec(aiohttp.ClientSession, instance=True)
@@ -137,6 +185,17 @@ class TestAuthorizedSession(object):
     TEST_URL = "http://example.com/"
     method = "GET"
 
+    @pytest.fixture(scope="class")
+    def _aioresponses(self):
+        # Patch aiohttp once for the whole class rather than once per test.
+        with aioresponses() as mocked:
+            yield mocked
+
+    @pytest.fixture
+    def mocked(self, _aioresponses):
+        yield _aioresponses
+        _aioresponses.clear()
+
     def test_constructor(self):
         authed_session = aiohttp_requests.AuthorizedSession(mock.sentinel.credentials)
         assert authed_session.credentials == mock.sentinel.credentials
@@ -151,95 +210,173 @@ class TestAuthorizedSession(object):
 
         assert authed_session._auth_request == auth_request
 
+    @pytest.mark.parametrize(
+        "method, url, mocked_responses, request_kwargs, check",
+        [
+            pytest.param(
+                "GET",
+                TEST_URL,
+                [dict(status=200, body="test")],
+                dict(headers={"Keep-Alive": "timeout=5, max=1000", "fake": b"bytes"}),
+                lambda responses, bodies: bodies == [b"test"],
+                id="basic",
+            ),
+            pytest.param(
+                "GET",
+                "http://test.example.com",
+                [dict(payload=dict(foo="bar"))],
+                {},
+                lambda responses, bodies: json.loads(bodies[0]) == dict(foo="bar"),
+                id="ctx",
+            ),
+            pytest.param(
+                "POST",
+                "http://example.com",
+                [dict(payload=dict(), headers=dict(connection="keep-alive"))],
+                {},
+                lambda responses, bodies: (
+                    responses[0].headers["Connection"] == "keep-alive"
+                ),
+                id="headers",
+            ),
+            pytest.param(
+                "GET",
+                "http://example.com",
+                [dict(status=500), dict(status=200)],
+                {},
+                None,
+                id="regexp",
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_request(self):
-        with aioresponses() as mocked:
-            credentials = mock.Mock(wraps=CredentialsStub())
+    async def test_request(
+        self, mocked, method, url, mocked_responses, request_kwargs, check
+    ):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        for mocked_response in mocked_responses:
+            mocked.add(url, method=method, **mocked_response)
+        session = aiohttp_requests.AuthorizedSession(credentials)
 
-            mocked.get(self.TEST_URL, status=200, body="test")
-            session = aiohttp_requests.AuthorizedSession(credentials)
-            resp = await session.request(
-                "GET",
-                "http://example.com/",
-                headers={"Keep-Alive": "timeout=5, max=1000", "fake": b"bytes"},
-            )
+        responses = []
+        bodies = []
+        for _ in mocked_responses:
+            response = await session.request(method, url, **request_kwargs)
+            responses.append(response)
+            bodies.append(await response.read())
 
-            assert resp.status == 200
-            assert "test" == await resp.text()
+        assert [response.status for response in responses] == [
+            mocked_response.get("status", 200) for mocked_response in mocked_responses
+        ]
+        if check is not None:
+            assert check(responses, bodies)
 
-            await session.close()
+        await session.close()
 
     @pytest.mark.asyncio
-    async def test_ctx(self):
-        with aioresponses() as mocked:
-            credentials = mock.Mock(wraps=CredentialsStub())
-            mocked.get("http://test.example.com", payload=dict(foo="bar"))
-            session = aiohttp_requests.AuthorizedSession(credentials)
-            resp = await session.request("GET", "http://test.example.com")
-            data = await resp.json()
+    async def test_request_max_allowed_time_exceeded(self, mocked):
+        credentials = mock.Mock(wraps=CredentialsStub())
 
-            assert dict(foo="bar") == data
+        async def slow_before_request(*args):
+            await asyncio.sleep(1)
 
-            await session.close()
+        credentials.before_request.side_effect = slow_before_request
+        mocked.get("http://example.com", status=200)
+        authed_session = aiohttp_requests.AuthorizedSession(credentials)
 
-    @pytest.mark.asyncio
-    async def test_http_headers(self):
-        with aioresponses() as mocked:
-            credentials = mock.Mock(wraps=CredentialsStub())
-            mocked.post(
-                "http://example.com",
-                payload=dict(),
-                headers=dict(connection="keep-alive"),
+        with pytest.raises(asyncio.TimeoutError):
+            await authed_session.request(
+                "GET", "http://example.com", max_allowed_time=0.01
             )
 
-            session = aiohttp_requests.AuthorizedSession(credentials)
-            resp = await session.request("POST", "http://example.com")
+        await authed_session.close()
 
-            assert resp.headers["Connection"] == "keep-alive"
+    @pytest.mark.asyncio
+    async def test_request_refresh_max_allowed_time(self, mocked):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        mocked.get("http://example.com", status=401)
+        mocked.get("http://example.com", status=200)
+        authed_session = aiohttp_requests.AuthorizedSession(credentials)
+        response = await authed_session.request(
+            "GET", "http://example.com", max_allowed_time=60
+        )
+        assert credentials.refresh.called
+        assert response.status == 200
 
-            await session.close()
+        await authed_session.close()
 
     @pytest.mark.asyncio
-    async def test_regexp_example(self):
-        with aioresponses() as mocked:
-            credentials = mock.Mock(wraps=CredentialsStub())
-            mocked.get("http://example.com", status=500)
-            mocked.get("http://example.com", status=200)
+    async def test_request_reuses_auth_request(self, mocked):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        mocked.get("http://example.com", status=200)
+        mocked.get("http://example.com", status=200)
+        authed_session = aiohttp_requests.AuthorizedSession(credentials)
 
-            session1 = aiohttp_requests.AuthorizedSession(credentials)
+        await authed_session.request("GET", "http://example.com")
+        auth_request = authed_session._auth_request
+        auth_request_session = authed_session._auth_request_session
+        await authed_session.request("GET", "http://example.com")
 
-            resp1 = await session1.request("GET", "http://example.com")
-            session2 = aiohttp_requests.AuthorizedSession(credentials)
-            resp2 = await session2.request("GET", "http://example.com")
+        assert authed_session._auth_request is auth_request
+        assert authed_session._auth_request_session is auth_request_session
 
-            assert resp1.status == 500
-            assert resp2.status == 200
+        await authed_session.close()
 
-            await session1.close()
-            await session2.close()
+        assert auth_request_session.closed
+        assert authed_session._auth_request_session is None
 
     @pytest.mark.asyncio
-    async def test_request_no_refresh(self):
+    async def test_auth_request_session_does_not_decompress(self, mocked):
         credentials = mock.Mock(wraps=CredentialsStub())
-        with aioresponses() as mocked:
-            mocked.get("http://example.com", status=200)
-            authed_session = aiohttp_requests.AuthorizedSession(credentials)
-            response = await authed_session.request("GET", "http://example.com")
-            assert response.status == 200
-            assert credentials.before_request.called
-            assert not credentials.refresh.called
+        mocked.get("http://example.com", status=200)
+        authed_session = aiohttp_requests.AuthorizedSession(
+            credentials, auto_decompress=True
+        )
+
+        await authed_session.request("GET", "http://example.com")
 
-            await authed_session.close()
+        assert authed_session._auth_request_session.auto_decompress is False
+
+        await authed_session.close()
 
     @pytest.mark.asyncio
-    async def test_request_refresh(self):
+    async def test_request_with_auth_request(self, mocked):
         credentials = mock.Mock(wraps=CredentialsStub())
-        with aioresponses() as mocked:
-            mocked.get("http://example.com", status=401)
-            mocked.get("http://example.com", status=200)
-            authed_session = aiohttp_requests.AuthorizedSession(credentials)
-            response = await authed_session.request("GET", "http://example.com")
-            assert credentials.refresh.called
-            assert response.status == 200
+        auth_request = aiohttp_requests.Request(
+            mock.create_autospec(aiohttp.ClientSession)
+        )
+        mocked.get("http://example.com", status=200)
+        authed_session = aiohttp_requests.AuthorizedSession(
+            credentials, auth_request=auth_request
+        )
+
+        await authed_session.request("GET", "http://example.com")
 
-            await authed_session.close()
+        assert authed_session._auth_request is auth_request
+        assert authed_session._auth_request_session is None
+
+        await authed_session.close()
+
+    @pytest.mark.asyncio
+    async def test_request_no_refresh(self, mocked):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        mocked.get("http://example.com", status=200)
+        authed_session = aiohttp_requests.AuthorizedSession(credentials)
+        response = await authed_session.request("GET", "http://example.com")
+        assert response.status == 200
+        assert credentials.before_request.called
+        assert not credentials.refresh.called
+
+        await authed_session.close()
+
+    @pytest.mark.asyncio
+    async def test_request_refresh(self, mocked):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        mocked.get("http://example.com", status=401)
+        mocked.get("http://example.com", status=200)
+        authed_session = aiohttp_requests.AuthorizedSession(credentials)
+        response = await authed_session.request("GET", "http://example.com")
+        assert credentials.refresh.called
+        assert response.status == 200
+
+        await authed_session.close()